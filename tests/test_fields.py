@@ -648,6 +648,19 @@ def test_date():
     value, error = validator.validate_or_error(datetime.date(2049, 1, 1))
     assert value == datetime.date(2049, 1, 1)
 
+    validator = Date()
+    value, error = validator.validate_or_error("2049-1-1")
+    assert value == datetime.date(2049, 1, 1)
+
+    for item in ["٢٠٤٩-1-1", "٢٠٤٩-01-01"]:
+        validator = Date()
+        value, error = validator.validate_or_error(item)
+        assert value == datetime.date(2049, 1, 1)
+
+    validator = Date()
+    value, error = validator.validate_or_error("2049-0a-01")
+    assert error == ValidationError(text="Must be a valid date format.", code="format")
+
     validator = Date()
     value, error = validator.validate_or_error("20490101")
     assert error == ValidationError(text="Must be a valid date format.", code="format")
@@ -656,6 +669,10 @@ def test_date():
     value, error = validator.validate_or_error("2049-01-32")
     assert error == ValidationError(text="Must be a real date.", code="invalid")
 
+    validator = Date()
+    value, error = validator.validate_or_error("2049-2-30")
+    assert error == ValidationError(text="Must be a real date.", code="invalid")
+
 
 def test_time():
     validator = Time()
@@ -678,10 +695,18 @@ def test_time():
     value, error = validator.validate_or_error("12.00.01")
     assert error == ValidationError(text="Must be a valid time format.", code="format")
 
+    validator = Time()
+    value, error = validator.validate_or_error("12:00:01 PM")
+    assert error == ValidationError(text="Must be a valid time format.", code="format")
+
     validator = Time()
     value, error = validator.validate_or_error("12:00:60")
     assert error == ValidationError(text="Must be a real time.", code="invalid")
 
+    validator = Time()
+    value, error = validator.validate_or_error("12:00:60.1")
+    assert error == ValidationError(text="Must be a real time.", code="invalid")
+
 
 def test_datetime():
     validator = DateTime()
@@ -697,6 +722,21 @@ def test_datetime():
     value, error = validator.validate_or_error("2049-1-1 12:00:00Z")
     assert value == datetime.datetime(2049, 1, 1, 12, 0, 0, tzinfo=tzinfo)
 
+    tzinfo = datetime.timezone.utc
+    validator = DateTime()
+    value, error = validator.validate_or_error("2049-01-01T12:00:00Z")
+    assert value == datetime.datetime(2049, 1, 1, 12, 0, 0, tzinfo=tzinfo)
+
+    tzinfo = datetime.timezone(datetime.timedelta(hours=5, minutes=30))
+    validator = DateTime()
+    value, error = validator.validate_or_error("2049-01-01T12:00:00.5+05:30")
+    assert value == datetime.datetime(2049, 1, 1, 12, 0, 0, 500000, tzinfo=tzinfo)
+
+    tzinfo = datetime.timezone(-datetime.timedelta(hours=2))
+    validator = DateTime()
+    value, error = validator.validate_or_error("2049-01-01T12:00:00.123456789-02")
+    assert value == datetime.datetime(2049, 1, 1, 12, 0, 0, 123456, tzinfo=tzinfo)
+
     tzinfo = datetime.timezone(-datetime.timedelta(hours=2, minutes=30))
     validator = DateTime()
     value, error = validator.validate_or_error("2049-1-1 12:00:00-0230")
@@ -716,6 +756,25 @@ def test_datetime():
     value, error = validator.validate_or_error("2049-01-01 12:00:60")
     assert error == ValidationError(text="Must be a real datetime.", code="invalid")
 
+    validator = DateTime()
+    value, error = validator.validate_or_error("2049-1-1 12:00:60")
+    assert error == ValidationError(text="Must be a real datetime.", code="invalid")
+
+    validator = DateTime()
+    value, error = validator.validate_or_error("2049-01-01 12:00:00+25:00")
+    assert error == ValidationError(text="Must be a real datetime.", code="invalid")
+
+    for item in [
+        "2049-01-01 12:00:00+5:00",
+        "2049-01-01 12:00:00.",
+        "2049-01-01 12:00:00:00",
+    ]:
+        validator = DateTime()
+        value, error = validator.validate_or_error(item)
+        assert error == ValidationError(
+            text="Must be a valid datetime format.", code="format"
+        )
+
 
 def test_uuid():
     validator = String(format="uuid")
@@ -726,6 +785,26 @@ def test_uuid():
     value, error = validator.validate_or_error("1245a678-1234-1234-1234-123412341234")
     assert error == ValidationError(text="Must be valid UUID format.", code="format")
 
+    validator = String(format="uuid")
+    value, error = validator.validate_or_error("93e19019-c7a6-45fe-8936-f6f4d550f35f0")
+    assert error == ValidationError(text="Must be valid UUID format.", code="format")
+
+    validator = String(format="uuid")
+    value, error = validator.validate_or_error("93e19019c7a6-45fe-8936-f6f4d550f35f0")
+    assert error == ValidationError(text="Must be valid UUID format.", code="format")
+
+    validator = String(format="uuid")
+    value, error = validator.validate_or_error("93E19019-C7A6-45FE-8936-F6F4D550F35F")
+    assert error == ValidationError(text="Must be valid UUID format.", code="format")
+
+    validator = String(format="uuid")
+    value, error = validator.validate_or_error("93e19019-c7a6-45fe-8936-f6f4d550f35é")
+    assert error == ValidationError(text="Must be valid UUID format.", code="format")
+
+    validator = String(format="uuid")
+    value, error = validator.validate_or_error("93e1901--c7a6-45fe-8936-f6f4d550f35f")
+    assert error == ValidationError(text="Must be valid UUID format.", code="format")
+
 
 def test_email():
     validator = String(format="email")
@@ -735,7 +814,8 @@ def test_email():
         assert value == item
 
     validator = String(format="email")
-    for item in ["info@python", "python@python", "python@user@python.org", "@python.org"]:
+    for item in ["info@python", "python@python", "python@user@python.org", "@python.org",
+                 "info.python.org", "info@.org"]:
         value, error = validator.validate_or_error(item)
         assert error == ValidationError(text="Must be valid Email format.", code="format")
 
@@ -744,7 +824,7 @@ def test_url():
     validator = String(format="url")
     for item in ["http://www.python.org", "https://www.python.org", "http://www.python007.org", "http://42.com",
                  "http://python.org", "http://python.org/intro", "https://python.org/intro/firstlesson/",
-                 "http://www.google.com"]:
+                 "http://www.google.com", "http://python.org/intro.html", "http://docs.python.org/3/"]:
         value, error = validator.validate_or_error(item)
         assert value == urllib.parse.urlparse(item)
 
@@ -755,7 +835,7 @@ def test_url():
         assert value == urllib.parse.urlparse("http://" + item)
 
     validator = String(format="url")
-    for item in ["python@sas", "pythonv7", ".com"]:
+    for item in ["python@sas", "pythonv7", ".com", "http://.com", "python.organic", "python.COM"]:
         value, error = validator.validate_or_error(item)
         assert error == ValidationError(text="Must be valid URL format.", code="format")
 
@@ -0,0 +1,130 @@
+import datetime
+import uuid
+import weakref
+
+import pytest
+
+from typesystem import formats
+from typesystem.base import ValidationError
+from typesystem.formats import BaseFormat, DateFormat, DateTimeFormat, UUIDFormat
+
+
+class NamedFormat(BaseFormat):
+    errors = {"format": "Must be a valid {name}."}
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+def test_unhashable_value():
+    with pytest.raises(TypeError):
+        DateFormat().validate(["2049-01-01"])
+
+
+def test_memoized_validate(monkeypatch):
+    monkeypatch.setattr(formats, "MEMOIZE_SIZE", 2)
+    validate = DateFormat().validate
+    validate.cache_clear()
+
+    date = validate("2049-01-01")
+    assert validate("2049-01-01") is date
+    assert DateFormat().validate("2049-01-01") is date
+
+    validate("2049-01-02")
+    validate("2049-01-03")
+    assert validate("2049-01-01") is not date
+
+
+class EqualFormat(DateFormat):
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, EqualFormat)
+
+
+def test_memoize_unhashable_format():
+    assert EqualFormat() == EqualFormat()
+    assert EqualFormat().validate("2049-01-01") == datetime.date(2049, 1, 1)
+
+
+def test_memoize_does_not_keep_formats():
+    date_format = EqualFormat()
+    date_format.validate("2049-01-01")
+    reference = weakref.ref(date_format)
+
+    del date_format
+    assert reference() is None
+
+
+def test_validation_error():
+    error = DateFormat().validation_error("format")
+    assert error == ValidationError(text="Must be a valid date format.", code="format")
+    assert error is not DateFormat().validation_error("format")
+
+    error = NamedFormat("colour").validation_error("format")
+    assert error == ValidationError(text="Must be a valid colour.", code="format")
+
+
+def test_error_texts_are_read_once(monkeypatch):
+    date_format = DateFormat()
+    date_format.errors = {"format": "Changed."}
+    monkeypatch.setitem(DateFormat.errors, "invalid", "Changed.")
+
+    error = date_format.validation_error("format")
+    assert error == ValidationError(text="Must be a valid date format.", code="format")
+    error = date_format.validation_error("invalid")
+    assert error == ValidationError(text="Must be a real date.", code="invalid")
+
+    class ChangedFormat(DateFormat):
+        errors = {"format": "Changed."}
+
+    error = ChangedFormat().validation_error("format")
+    assert error == ValidationError(text="Changed.", code="format")
+
+
+def test_errors_are_not_shared():
+    with pytest.raises(ValidationError) as first:
+        try:
+            {}["missing"]
+        except KeyError:
+            DateFormat().validate("2049-1-x")
+    with pytest.raises(ValidationError) as second:
+        DateFormat().validate("2049-1-y")
+
+    assert first.value is not second.value
+    assert second.value.__context__ is None
+
+
+def test_datetime_serialize():
+    serialize = DateTimeFormat().serialize
+    utc = datetime.timezone.utc
+    offset = datetime.timezone(datetime.timedelta(hours=5))
+    zero = datetime.timezone(datetime.timedelta(0))
+
+    assert serialize(datetime.datetime(2049, 1, 1, 12)) == "2049-01-01T12:00:00"
+    assert serialize(datetime.datetime(2049, 1, 1, 12, tzinfo=utc)) == (
+        "2049-01-01T12:00:00Z"
+    )
+    assert serialize(datetime.datetime(2049, 1, 1, 12, 0, 0, 5, tzinfo=zero)) == (
+        "2049-01-01T12:00:00.000005Z"
+    )
+    assert serialize(datetime.datetime(2049, 1, 1, 12, tzinfo=offset)) == (
+        "2049-01-01T12:00:00+05:00"
+    )
+
+
+def test_timezones_are_shared(monkeypatch):
+    monkeypatch.setattr(formats, "TZ_CACHE_SIZE", 2)
+    monkeypatch.setattr(formats, "_TZ_CACHE", {})
+
+    assert formats._parse_tzinfo("+05:30") is formats._parse_tzinfo("+0530")
+
+    formats._parse_tzinfo("-08:00")
+    formats._parse_tzinfo("+01")
+    assert formats._TZ_CACHE == {60: datetime.timezone(datetime.timedelta(hours=1))}
+
+
+def test_lazy_module(monkeypatch):
+    monkeypatch.setattr(formats, "uuid", formats._LazyModule("uuid"))
+    value = uuid.UUID("93e19019-c7a6-45fe-8936-f6f4d550f35f")
+
+    assert UUIDFormat().is_native_type(value)
+    assert formats.uuid is uuid
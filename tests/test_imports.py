@@ -0,0 +1,27 @@
+import sys
+
+import pytest
+
+import typesystem
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="requires module __getattr__")
+@pytest.mark.parametrize("name", ["forms", "json_schema", "tokenize"])
+def test_lazy_submodules(monkeypatch, name):
+    monkeypatch.delattr(typesystem, name, raising=False)
+
+    module = getattr(typesystem, name)
+    assert module is sys.modules[f"typesystem.{name}"]
+    assert typesystem.__dict__[name] is module
+
+
+def test_missing_attribute():
+    with pytest.raises(AttributeError):
+        typesystem.missing
+
+
+def test_dir():
+    names = dir(typesystem)
+    assert set(typesystem.__all__) <= set(names)
+    assert "to_json_schema" in names
+    assert "__version__" in names
@@ -238,7 +238,7 @@ def test_schema_datetime_serialization():
     check_in = datetime.datetime.now(tz=datetime.timezone.utc)
     guest = Guest(id=guest_id, name=guest_name, check_in=check_in)
 
-    assert typesystem.formats.DATETIME_REGEX.match(guest["check_in"])
+    assert typesystem.formats.DATETIME_REGEX.fullmatch(guest["check_in"])
     assert guest["id"] == guest_id
     assert guest["name"] == guest_name
     assert guest["check_in"] == check_in.isoformat()[:-6] + "Z"
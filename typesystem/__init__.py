@@ -1,3 +1,7 @@
+import importlib
+import sys
+import typing
+
 from typesystem.base import Message, ParseError, Position, ValidationError
 from typesystem.fields import (
     Any,
@@ -19,12 +23,44 @@ from typesystem.fields import (
     Union,
     URL
 )
-from typesystem.forms import Jinja2Forms
-from typesystem.json_schema import from_json_schema, to_json_schema
 from typesystem.schemas import Reference, Schema, SchemaDefinitions
-from typesystem.tokenize.positional_validation import validate_with_positions
-from typesystem.tokenize.tokenize_json import tokenize_json, validate_json
-from typesystem.tokenize.tokenize_yaml import tokenize_yaml, validate_yaml
+
+#  Forms, JSON Schema and tokenizing pull in optional dependencies such as
+#  `jinja2` and `pyyaml`, so on Python 3.7+ they are only imported when first
+#  accessed, via a module level `__getattr__`.
+_LAZY_SUBMODULES = ("forms", "json_schema", "tokenize")
+_LAZY_IMPORTS = {
+    "Jinja2Forms": "typesystem.forms",
+    "from_json_schema": "typesystem.json_schema",
+    "to_json_schema": "typesystem.json_schema",
+    "validate_with_positions": "typesystem.tokenize.positional_validation",
+    "tokenize_json": "typesystem.tokenize.tokenize_json",
+    "validate_json": "typesystem.tokenize.tokenize_json",
+    "tokenize_yaml": "typesystem.tokenize.tokenize_yaml",
+    "validate_yaml": "typesystem.tokenize.tokenize_yaml",
+}
+
+if typing.TYPE_CHECKING or sys.version_info < (3, 7):  # pragma: no cover
+    from typesystem.forms import Jinja2Forms
+    from typesystem.json_schema import from_json_schema, to_json_schema
+    from typesystem.tokenize.positional_validation import validate_with_positions
+    from typesystem.tokenize.tokenize_json import tokenize_json, validate_json
+    from typesystem.tokenize.tokenize_yaml import tokenize_yaml, validate_yaml
+else:
+
+    def __getattr__(name: str) -> typing.Any:
+        if name in _LAZY_IMPORTS:
+            value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        elif name in _LAZY_SUBMODULES:
+            value = importlib.import_module(f"{__name__}.{name}")
+        else:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        globals()[name] = value
+        return value
+
+    def __dir__() -> typing.List[str]:
+        return sorted(set(globals()) | set(__all__))
+
 
 __version__ = "0.2.5"
 __all__ = [
@@ -1,4 +1,5 @@
 import decimal
+import itertools
 import re
 import typing
 from math import isfinite
@@ -628,21 +629,29 @@ class Array(Field):
         if self.unique_items:
             seen_items = Uniqueness()
 
-        for pos, item in enumerate(value):
-            validator = None
-            if isinstance(self.items, list):
-                if pos < len(self.items):
-                    validator = self.items[pos]
-                elif isinstance(self.additional_items, Field):
-                    validator = self.additional_items
-            elif self.items is not None:
-                validator = self.items
+        # Resolve the validator for each position once, up front, rather than
+        # re-inspecting the `items` configuration for every element.
+        validators: typing.Iterable[typing.Optional[Field]]
+        if isinstance(self.items, list):
+            additional_items = (
+                self.additional_items
+                if isinstance(self.additional_items, Field)
+                else None
+            )
+            validators = self.items[: len(value)] + [additional_items] * (
+                len(value) - len(self.items)
+            )
+        else:
+            validators = itertools.repeat(self.items)
 
+        for pos, (item, validator) in enumerate(zip(value, validators)):
             if validator is None:
                 validated.append(item)
             else:
-                item, error = validator.validate_or_error(item, strict=strict)
-                if error:
+                try:
+                    item = validator.validate(item, strict=strict)
+                except ValidationError as error:
+                    item = None
                     error_messages += error.messages(add_prefix=pos)
                 else:
                     validated.append(item)
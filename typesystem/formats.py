@@ -1,14 +1,42 @@
 import datetime
+import functools
+import importlib
 import re
+import sys
 import typing
-import uuid
-import urllib.parse
-
 
 from typesystem.base import ValidationError
 
+
+class _LazyModule:
+    """
+    A placeholder for a module global, which imports the module and rebinds
+    the global to it on first attribute access. Later lookups then go straight
+    to the real module.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __getattr__(self, attr: str) -> typing.Any:
+        importlib.import_module(self._name)
+        top_level = self._name.partition(".")[0]
+        module = sys.modules[top_level]
+        globals()[top_level] = module
+        return getattr(module, attr)
+
+
+#  `uuid` and `urllib.parse` are only needed by a few formats, so they're not
+#  imported until first used, to keep `import typesystem` lightweight.
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import uuid
+    import urllib.parse
+else:
+    uuid = _LazyModule("uuid")
+    urllib = _LazyModule("urllib.parse")
+
 DATE_REGEX = re.compile(
-    r"(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})$"
+    r"(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})"
 )
 
 TIME_REGEX = re.compile(
@@ -20,35 +48,206 @@ DATETIME_REGEX = re.compile(
     r"(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})"
     r"[T ](?P<hour>\d{1,2}):(?P<minute>\d{1,2})"
     r"(?::(?P<second>\d{1,2})(?:\.(?P<microsecond>\d{1,6})\d{0,6})?)?"
-    r"(?P<tzinfo>Z|[+-]\d{2}(?::?\d{2})?)?$"
+    r"(?P<tzinfo>Z|[+-]\d{2}(?::?\d{2})?)?"
 )
 
-UUID_REGEX = re.compile(
-    r"[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}"
-)
+#  A `bytes.translate()` table mapping lowercase hex digits and "-" to 1, and
+#  any other byte to 0.
+UUID_TABLE = bytes(int(chr(i) in "0123456789abcdef-") for i in range(256))
 
 #  Most common extensions are copied from
 #  https://www.lifewire.com/most-common-tlds-internet-domain-extensions-817511
-TOP_DOMAINS = "com|org|net|us|co|int|mil|edu|gov|biz|info|jobs|mobi|name" + \
-    "|ly|tel|kitchen|email|tech|estate|xyz|codes|bargains|bid|expert|ca" + \
-    "|cn|fr|ch|au|in|de|jp|nl|uk|mx|no|ru|br|se|es|us"
-
-#  F-string forces us to use 3.6+ python
-URL_REGEX = re.compile(
-    rf"\b(http[s]?://)?([^:\s]+)(\.\w+)*\.({TOP_DOMAINS})(/[\w\-.]+[^#?\s]+)*/?\b"
+TOP_DOMAINS = frozenset(
+    "com org net us co int mil edu gov biz info jobs mobi name"
+    " ly tel kitchen email tech estate xyz codes bargains bid expert ca"
+    " cn fr ch au in de jp nl uk mx no ru br se es".split()
 )
 
+#  The structural part of a URL: an optional scheme, followed by the host and
+#  path. The host must contain some ".<tld>" with a TLD from `TOP_DOMAINS`,
+#  which is checked with a set lookup against `TLD_REGEX` candidates, rather
+#  than as a large alternation inside the regex.
+URL_REGEX = re.compile(r"\b(http[s]?://)?([^:\s]+)")
+
+TLD_REGEX = re.compile(r"\.(\w+)")
+
 EMAIL_REGEX = re.compile(
-    r"(^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$)"
+    r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+"
 )
 
 
+#  The regular expressions above accept a fairly loose grammar, but the vast
+#  majority of real-world input uses the fixed-width "YYYY-MM-DD" and
+#  "HH:MM:SS" shapes. We special-case those common shapes with plain character
+#  checks so that they skip the regex engine entirely, and fall back to the
+#  regular expressions for anything else.
+
+
+def _is_fixed_date(value: str) -> bool:
+    return (
+        value[4] == "-"
+        and value[7] == "-"
+        and value[0:4].isdecimal()
+        and value[5:7].isdecimal()
+        and value[8:10].isdecimal()
+    )
+
+
+def _is_fixed_time(value: str) -> bool:
+    return (
+        value[2] == ":"
+        and value[5] == ":"
+        and value[0:2].isdecimal()
+        and value[3:5].isdecimal()
+        and value[6:8].isdecimal()
+    )
+
+
+def _is_fixed_tzinfo(value: str) -> bool:
+    # Check for a "[+-]HH", "[+-]HHMM" or "[+-]HH:MM" offset.
+    if len(value) == 6:
+        return value[3] == ":" and value[1:3].isdecimal() and value[4:].isdecimal()
+    return len(value) in (3, 5) and value[1:].isdecimal()
+
+
+def _split_fixed_datetime(value: str) -> typing.Optional[typing.Tuple]:
+    """
+    Split a datetime with a fixed-width "YYYY-MM-DD[T ]HH:MM:SS" prefix into
+    its integer fields, followed by any timezone suffix.
+
+    Returns `None` for any other shape, which should fall back to the regex.
+    """
+    if not (
+        len(value) >= 19
+        and value[10] in "T "
+        and _is_fixed_date(value)
+        and _is_fixed_time(value[11:19])
+    ):
+        return None
+
+    rest = value[19:]
+    tzinfo_str = None
+    if rest.endswith("Z"):
+        tzinfo_str, rest = "Z", rest[:-1]
+    else:
+        sign = max(rest.rfind("+"), rest.rfind("-"))
+        if sign != -1:
+            tzinfo_str, rest = rest[sign:], rest[:sign]
+            if not _is_fixed_tzinfo(tzinfo_str):
+                return None
+
+    microsecond = 0
+    if rest:
+        digits = rest[1:]
+        if rest[0] != "." or not 0 < len(digits) <= 12 or not digits.isdecimal():
+            return None
+        microsecond = int(digits[:6].ljust(6, "0"))
+
+    return (
+        int(value[0:4]),
+        int(value[5:7]),
+        int(value[8:10]),
+        int(value[11:13]),
+        int(value[14:16]),
+        int(value[17:19]),
+        microsecond,
+        tzinfo_str,
+    )
+
+
+#  Shared timezones, keyed by their UTC offset in minutes. Only a few dozen
+#  offsets are in real-world use, so this stays small, but we clear it if it
+#  ever grows beyond `TZ_CACHE_SIZE` entries.
+TZ_CACHE_SIZE = 128
+_TZ_CACHE: typing.Dict[int, datetime.timezone] = {0: datetime.timezone.utc}
+
+
+def _parse_tzinfo(tzinfo_str: typing.Optional[str]) -> typing.Optional[datetime.tzinfo]:
+    if tzinfo_str is None:
+        return None
+    elif tzinfo_str == "Z":
+        return datetime.timezone.utc
+
+    # Work out the signed offset as a plain integer, so that we only need to
+    # build a single timedelta.
+    offset = int(tzinfo_str[1:3]) * 60
+    if len(tzinfo_str) > 3:
+        offset += int(tzinfo_str[-2:])
+    if tzinfo_str[0] == "-":
+        offset = -offset
+
+    tzinfo = _TZ_CACHE.get(offset)
+    if tzinfo is None:
+        tzinfo = datetime.timezone(datetime.timedelta(minutes=offset))
+        if len(_TZ_CACHE) >= TZ_CACHE_SIZE:
+            _TZ_CACHE.clear()
+        _TZ_CACHE[offset] = tzinfo
+    return tzinfo
+
+
+#  The most results each memoized `validate()` keeps, before its cache is
+#  cleared and starts over.
+MEMOIZE_SIZE = 1024
+
+_MISSING = object()
+
+
+def _memoize(validate: typing.Callable) -> typing.Callable:
+    """
+    Cache the results of a format's `validate()` for recently seen values.
+    Only worth using for formats whose values tend to recur throughout a
+    payload, such as dates and times, since a cache miss costs extra.
+
+    The cache is keyed on the value alone, so the result must not depend on
+    the format instance, and no instances are kept alive by it. Only
+    successful results are cached, and these must be immutable. Unhashable
+    values skip the cache. The cache is shared by every instance of the
+    class, and can be reset with `validate.cache_clear()`.
+    """
+    cache: typing.Dict[typing.Any, typing.Any] = {}
+
+    @functools.wraps(validate)
+    def wrapper(self: "BaseFormat", value: typing.Any) -> typing.Any:
+        try:
+            result = cache.get(value, _MISSING)
+        except TypeError:
+            return validate(self, value)
+        if result is _MISSING:
+            result = validate(self, value)
+            if len(cache) >= MEMOIZE_SIZE:
+                cache.clear()
+            cache[value] = result
+        return result
+
+    wrapper.cache_clear = cache.clear  # type: ignore
+    return wrapper
+
+
 class BaseFormat:
+    """
+    The `errors` texts are read once, when the class is created, so they
+    should be customized by overriding `errors` on a subclass, rather than
+    by modifying the dict or setting `errors` on an instance afterwards.
+    """
+
     errors: typing.Dict[str, str] = {}
 
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Expose each error text as an `_err_<code>` attribute, so that
+        # `validation_error()` only needs a plain attribute lookup. Texts without any "{...}"
+        # placeholders never vary, so only the others need formatting.
+        for code, text in cls.errors.items():
+            error: typing.Any = text
+            if "{" in text:
+                error = property(functools.partial(BaseFormat._format_text, text=text))
+            setattr(cls, f"_err_{code}", error)
+
+    def _format_text(self, text: str) -> str:
+        return text.format(**self.__dict__)
+
     def validation_error(self, code: str) -> ValidationError:
-        text = self.errors[code].format(**self.__dict__)
-        return ValidationError(text=text, code=code)
+        return ValidationError(text=getattr(self, f"_err_{code}"), code=code)
 
     def is_native_type(self, value: typing.Any) -> bool:
         raise NotImplementedError()  # pragma: no cover
@@ -69,14 +268,21 @@ class DateFormat(BaseFormat):
     def is_native_type(self, value: typing.Any) -> bool:
         return isinstance(value, datetime.date)
 
+    @_memoize
     def validate(self, value: typing.Any) -> datetime.date:
-        match = DATE_REGEX.match(value)
+        if len(value) == 10 and _is_fixed_date(value):
+            try:
+                return datetime.date(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+            except ValueError:
+                raise self.validation_error("invalid")
+
+        match = DATE_REGEX.fullmatch(value)
         if not match:
             raise self.validation_error("format")
 
-        kwargs = {k: int(v) for k, v in match.groupdict().items()}
+        year, month, day = match.groups()
         try:
-            return datetime.date(**kwargs)
+            return datetime.date(int(year), int(month), int(day))
         except ValueError:
             raise self.validation_error("invalid")
 
@@ -98,18 +304,26 @@ class TimeFormat(BaseFormat):
     def is_native_type(self, value: typing.Any) -> bool:
         return isinstance(value, datetime.time)
 
+    @_memoize
     def validate(self, value: typing.Any) -> datetime.time:
-        match = TIME_REGEX.match(value)
+        if len(value) == 8 and _is_fixed_time(value):
+            try:
+                return datetime.time(int(value[0:2]), int(value[3:5]), int(value[6:8]))
+            except ValueError:
+                raise self.validation_error("invalid")
+
+        match = TIME_REGEX.fullmatch(value)
         if not match:
             raise self.validation_error("format")
 
-        groups = match.groupdict()
-        if groups["microsecond"]:
-            groups["microsecond"] = groups["microsecond"].ljust(6, "0")
-
-        kwargs = {k: int(v) for k, v in groups.items() if v is not None}
+        hour, minute, second, microsecond = match.groups()
         try:
-            return datetime.time(tzinfo=None, **kwargs)
+            return datetime.time(
+                int(hour),
+                int(minute),
+                int(second) if second else 0,
+                int(microsecond.ljust(6, "0")) if microsecond else 0,
+            )
         except ValueError:
             raise self.validation_error("invalid")
 
@@ -132,30 +346,32 @@ class DateTimeFormat(BaseFormat):
         return isinstance(value, datetime.datetime)
 
     def validate(self, value: typing.Any) -> datetime.datetime:
-        match = DATETIME_REGEX.match(value)
+        parts = _split_fixed_datetime(value)
+        if parts is not None:
+            *fields, tzinfo_str = parts
+            try:
+                tzinfo = _parse_tzinfo(tzinfo_str)
+                return datetime.datetime(*fields, tzinfo=tzinfo)  # type: ignore
+            except ValueError:
+                raise self.validation_error("invalid")
+
+        match = DATETIME_REGEX.fullmatch(value)
         if not match:
             raise self.validation_error("format")
 
-        groups = match.groupdict()
-        if groups["microsecond"]:
-            groups["microsecond"] = groups["microsecond"].ljust(6, "0")
-
-        tzinfo_str = groups.pop("tzinfo")
-        if tzinfo_str == "Z":
-            tzinfo = datetime.timezone.utc
-        elif tzinfo_str is not None:
-            offset_mins = int(tzinfo_str[-2:]) if len(tzinfo_str) > 3 else 0
-            offset_hours = int(tzinfo_str[1:3])
-            delta = datetime.timedelta(hours=offset_hours, minutes=offset_mins)
-            if tzinfo_str[0] == "-":
-                delta = -delta
-            tzinfo = datetime.timezone(delta)
-        else:
-            tzinfo = None
-
-        kwargs = {k: int(v) for k, v in groups.items() if v is not None}
+        year, month, day, hour, minute, second, microsecond, tzinfo_str = match.groups()
         try:
-            return datetime.datetime(**kwargs, tzinfo=tzinfo)  # type: ignore
+            tzinfo = _parse_tzinfo(tzinfo_str)
+            return datetime.datetime(
+                int(year),
+                int(month),
+                int(day),
+                int(hour),
+                int(minute),
+                int(second) if second else 0,
+                int(microsecond.ljust(6, "0")) if microsecond else 0,
+                tzinfo=tzinfo,
+            )
         except ValueError:
             raise self.validation_error("invalid")
 
@@ -165,12 +381,18 @@ class DateTimeFormat(BaseFormat):
 
         assert isinstance(obj, datetime.datetime)
 
-        value = obj.isoformat()
-
-        if value.endswith("+00:00"):
-            value = value[:-6] + "Z"
+        # Build UTC datetimes directly in their "Z" form, rather than via
+        # `isoformat()` and then replacing the "+00:00" suffix.
+        if obj.tzinfo is datetime.timezone.utc or (
+            obj.tzinfo is not None and obj.utcoffset() == datetime.timedelta(0)
+        ):
+            microsecond = f".{obj.microsecond:06d}" if obj.microsecond else ""
+            return (
+                f"{obj.year:04d}-{obj.month:02d}-{obj.day:02d}T"
+                f"{obj.hour:02d}:{obj.minute:02d}:{obj.second:02d}{microsecond}Z"
+            )
 
-        return value
+        return obj.isoformat()
 
 
 class UUIDFormat(BaseFormat):
@@ -179,12 +401,25 @@ class UUIDFormat(BaseFormat):
     def is_native_type(self, value: typing.Any) -> bool:
         return isinstance(value, uuid.UUID)
 
-    def validate(self, value: typing.Any) -> uuid.UUID:
-        match = UUID_REGEX.match(value)
-        if not match:
+    def validate(self, value: typing.Any) -> "uuid.UUID":
+        # Check the layout, version and variant digits, and lowercase hex that
+        # `uuid.UUID()` itself would not enforce.
+        if (
+            len(value) != 36
+            or value[8] != "-"
+            or value[13] != "-"
+            or value[18] != "-"
+            or value[23] != "-"
+            or value[14] not in "12345"
+            or value[19] not in "89ab"
+            or 0 in value.encode("ascii", "replace").translate(UUID_TABLE)
+        ):
             raise self.validation_error("format")
 
-        return uuid.UUID(value)
+        try:
+            return uuid.UUID(value)
+        except ValueError:
+            raise self.validation_error("format")
 
     def serialize(self, obj: typing.Any) -> str:
         return str(obj)
@@ -196,11 +431,16 @@ class URLFormat(BaseFormat):
     def is_native_type(self, value: typing.Any) -> bool:
         return isinstance(value, urllib.parse.ParseResult)
 
-    def validate(self, value: typing.Any) -> urllib.parse.ParseResult:
+    def validate(self, value: typing.Any) -> "urllib.parse.ParseResult":
         match = URL_REGEX.match(value)
         if not match:
             raise self.validation_error("format")
 
+        # Skip the first character of the host, which can't be the TLD's ".".
+        tlds = TLD_REGEX.findall(match.group(2), 1)
+        if TOP_DOMAINS.isdisjoint(tlds):
+            raise self.validation_error("format")
+
         # I know it is URL, lets check if it starts with http
         if not value.startswith("http"):
             value = "http://" + value
@@ -221,8 +461,8 @@ class EmailFormat(BaseFormat):
     def is_native_type(self, value: typing.Any) -> bool:
         return isinstance(value, urllib.parse.ParseResult)
 
-    def validate(self, value: typing.Any) -> urllib.parse.ParseResult:
-        match = EMAIL_REGEX.match(value)
+    def validate(self, value: typing.Any) -> "urllib.parse.ParseResult":
+        match = EMAIL_REGEX.fullmatch(value)
         if not match:
             raise self.validation_error("format")
 
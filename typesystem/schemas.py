@@ -81,6 +81,9 @@ class SchemaMetaclass(ABCMeta):
             sorted(fields.items(), key=lambda item: item[1]._creation_counter)
         )
 
+        # Validators built by `make_validator()`, keyed by `strict`.
+        attrs["_validators"] = {}
+
         new_type = super(SchemaMetaclass, cls).__new__(  # type: ignore
             cls, name, bases, attrs
         )
@@ -91,6 +94,7 @@ class SchemaMetaclass(ABCMeta):
 
 class Schema(Mapping, metaclass=SchemaMetaclass):
     fields: typing.Dict[str, Field] = {}
+    _validators: typing.Dict[bool, Field] = {}
 
     def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
         if args:
@@ -143,7 +147,12 @@ class Schema(Mapping, metaclass=SchemaMetaclass):
     def validate(
         cls: typing.Type["Schema"], value: typing.Any, *, strict: bool = False
     ) -> "Schema":
-        validator = cls.make_validator(strict=strict)
+        # The fields are fixed once the class is created, so we only need to
+        # build the validator for each `strict` setting once.
+        try:
+            validator = cls._validators[strict]
+        except KeyError:
+            validator = cls._validators[strict] = cls.make_validator(strict=strict)
         value = validator.validate(value, strict=strict)
         return cls(value)
 